@@ -10,13 +10,25 @@ eliminate the repetitive point‑and‑click work and obtain a clean list of
 courses and their enrollment numbers.
 
 Prerequisites:
-  * Python 3.7 or higher
+  * Python 3.10 or higher
   * Selenium (`pip install selenium`)
-  * webdriver‑manager (`pip install webdriver-manager`)
+  * lxml (`pip install lxml`)
+  * webdriver‑manager (`pip install webdriver-manager`), unless
+    `CHROMEDRIVER_PATH` is set (see below)
+
+By default the script asks webdriver‑manager for a chromedriver matching
+the installed Chrome (and remembers the answer).  To skip that entirely,
+point the `CHROMEDRIVER_PATH` environment variable at a chromedriver
+binary; webdriver‑manager is then not needed at all.
 
 The script uses Chrome in headless mode by default.  If you would like to
-watch it run in a visible browser window, change the `headless` option to
-False in the `get_driver()` function.
+watch it run in a visible browser window, pass `--show-browser`.
+
+With `--reuse-browser` the script starts Chrome once with a remote debugging
+port on localhost:9222 (profile under ~/.cache/ru_scraper/chrome_profile)
+and leaves it running; later invocations attach to that browser and work in
+a new tab, skipping the browser start‑up cost.  The debugging port is not
+authenticated, so stop the browser with `--stop-browser` when you are done.
 
 Term codes:
 RU encodes academic terms with a six‑digit number where the first four
@@ -37,10 +49,18 @@ semester.
 
 Usage:
     python cs_course_enrollment.py --term 202610
+    python cs_course_enrollment.py --terms 202610,202620,202630
 
 The script will print a table of courses (title, class code, enrolled/limit,
 and wait list) to standard output.  You can also save the results as CSV
-using the `--csv` option.
+using the `--csv` option.  Results are cached under ~/.cache/ru_scraper for
+an hour (a notice on standard error says when cached figures are used); use
+`--cache-ttl SECONDS` to change that or `--no-cache` to always query
+Banner.  With `--terms` the terms are fetched concurrently (at most
+`--max-concurrency` at a time) and, when saving CSV, each term is written
+to its own file with the term code appended to the file name.  A term that
+fails is reported on standard error without discarding the others, and the
+script then exits with a non‑zero status.
 
 Author: ChatGPT (August 2025)
 """
@@ -48,31 +68,304 @@ Author: ChatGPT (August 2025)
 from __future__ import annotations
 
 import argparse
+import asyncio
 import csv
+import functools
+import json
+import os
+import pickle
+import re
+import shutil
+import signal
+import socket
+import subprocess
 import sys
+import threading
 import time
-from dataclasses import dataclass
-from typing import List
+import urllib.request
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
 
+import lxml.html
+from lxml import etree
 from selenium.webdriver import Chrome, ChromeOptions
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 
 
-@dataclass
+_CACHE_DIR = Path("~/.cache/ru_scraper").expanduser()
+# Where we remember the chromedriver that webdriver-manager resolved, so that
+# scheduled runs do not have to ask the network for it every time.
+_DRIVER_PATH_CACHE = _CACHE_DIR / "chromedriver_path"
+# Enrollment figures change slowly, so by default a term scraped within the
+# last hour is served from disk instead of asking Banner again.
+DEFAULT_CACHE_TTL = 3600.0
+# Bump whenever CourseInfo changes shape so that old pickles are ignored.
+_RESULTS_CACHE_VERSION = 2
+# `--terms` starts several browsers at once; only one thread at a time may
+# resolve (and possibly download) the driver.
+_DRIVER_PATH_LOCK = threading.Lock()
+_CHROME_BINARIES = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome")
+_CHROME_VERSION_RE = re.compile(r"(\d+)\.\d+")
+# Enrollment and wait list figures are shown as "current / limit".
+_PAIR_RE = re.compile(r"\s*(\d+)\s*/\s*(\d+)")
+
+# Command line switches shared by browsers Selenium starts for us and the
+# long-lived browser started by `_launch_persistent_browser`.  Only the page
+# text matters to us, so skip images and other background work that would
+# otherwise slow each page load.
+_CHROME_ARGS = (
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--blink-settings=imagesEnabled=false",
+    "--disable-background-networking",
+    "--disable-extensions",
+    "--disable-default-apps",
+    "--mute-audio",
+    "--no-first-run",
+    # Avoid detection where possible
+    "--disable-blink-features=AutomationControlled",
+)
+DEFAULT_DEBUGGING_ADDRESS = ("localhost", 9222)
+# The long-lived browser keeps its profile and PID in the per-user cache
+# directory rather than in a shared, predictable location under /tmp.
+_PERSISTENT_PROFILE_DIR = _CACHE_DIR / "chrome_profile"
+_PERSISTENT_PID_FILE = _CACHE_DIR / "chrome.pid"
+
+# Compiled once; these are evaluated for every course box on the page.  The
+# class tests use the usual concat/normalize-space idiom so that boxes with
+# additional CSS classes still match.
+_COURSE_BOX_XPATH = etree.XPath(
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' courseResultsBox ')]"
+)
+_COURSE_NAME_XPATH = etree.XPath(
+    ".//div[contains(concat(' ', normalize-space(@class), ' '), ' courseName ')]"
+)
+_CLASS_XPATH = etree.XPath(
+    ".//*[@id='classID']//*[contains(concat(' ', normalize-space(@class), ' '), ' dataValue ')]"
+)
+_ENROLLED_XPATH = etree.XPath(
+    ".//*[@id='enrollID']//*[contains(concat(' ', normalize-space(@class), ' '), ' dataValue ')]"
+)
+_WAIT_XPATH = etree.XPath(
+    ".//*[@id='waitID']//*[contains(concat(' ', normalize-space(@class), ' '), ' dataValue ')]"
+)
+
+
+@dataclass(slots=True, frozen=True)
 class CourseInfo:
-    """Simple container for the course information we care about."""
+    """Simple container for the course information we care about.
+
+    `enrolled` and `wait_list` keep the "current / limit" text as shown by
+    Banner for display; the numeric fields are parsed from them once when
+    the object is created.
+    """
 
     title: str
     class_code: str
     enrolled: str
     wait_list: str
+    enrolled_count: int = field(init=False, repr=False)
+    enrolled_limit: int = field(init=False, repr=False)
+    wait_count: int = field(init=False, repr=False)
+    wait_limit: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        enrolled_count, enrolled_limit = _parse_pair(self.enrolled)
+        wait_count, wait_limit = _parse_pair(self.wait_list)
+        object.__setattr__(self, "enrolled_count", enrolled_count)
+        object.__setattr__(self, "enrolled_limit", enrolled_limit)
+        object.__setattr__(self, "wait_count", wait_count)
+        object.__setattr__(self, "wait_limit", wait_limit)
+
+    def csv_row(self) -> Tuple[str, str, str, str]:
+        """Return the values written to CSV, in column order."""
+        return (self.title, self.class_code, self.enrolled, self.wait_list)
+
+
+def _parse_pair(pair: str) -> Tuple[int, int]:
+    """Parse strings like "9 / 25" into their current and limit values.
+
+    Anything that does not look like such a pair is treated as (0, 0).
+    """
+    m = _PAIR_RE.match(pair)
+    return (int(m.group(1)), int(m.group(2))) if m else (0, 0)
+
+
+def _text(element) -> str:
+    """Return an element's text with runs of whitespace collapsed.
+
+    Source indentation and line breaks inside a field would otherwise end
+    up in the table and the CSV; this matches what the browser renders.
+    """
+    return " ".join(element.text_content().split())
+
+
+def _find_chrome() -> str | None:
+    """Return the path of the locally installed Chrome binary, if any."""
+    for name in _CHROME_BINARIES:
+        binary = shutil.which(name)
+        if binary is not None:
+            return binary
+    return None
+
+
+def _chrome_major_version() -> str | None:
+    """Return the major version of the locally installed Chrome, if any."""
+    binary = _find_chrome()
+    if binary is None:
+        return None
+    try:
+        output = subprocess.run(
+            [binary, "--version"], capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = _CHROME_VERSION_RE.search(output)
+    return match.group(1) if match else None
+
+
+def _resolve_driver_path() -> str:
+    """Return a chromedriver path, reusing the cached one when possible.
+
+    A driver pinned with the CHROMEDRIVER_PATH environment variable always
+    wins.  Otherwise the cache records the Chrome major version the driver
+    was resolved for; if Chrome has been upgraded (or its version cannot be
+    determined) we go back to webdriver-manager.  Concurrent callers are
+    serialised and the answer is remembered for the rest of the process.
+    """
+    pinned = os.environ.get("CHROMEDRIVER_PATH")
+    if pinned:
+        return pinned
+    with _DRIVER_PATH_LOCK:
+        return _lookup_driver_path()
+
+
+@functools.lru_cache(maxsize=None)
+def _lookup_driver_path() -> str:
+    version = _chrome_major_version()
+    if version is not None:
+        try:
+            cached_version, cached_path = _DRIVER_PATH_CACHE.read_text(encoding="utf-8").split("\n", 1)
+        except (OSError, ValueError):
+            pass
+        else:
+            cached_path = cached_path.strip()
+            if cached_version == version and os.access(cached_path, os.X_OK):
+                return cached_path
+
+    # Imported here so that a pinned CHROMEDRIVER_PATH does not require
+    # webdriver-manager to be installed.
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    driver_path = ChromeDriverManager().install()
+    if version is not None:
+        try:
+            _DRIVER_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            _DRIVER_PATH_CACHE.write_text(f"{version}\n{driver_path}\n", encoding="utf-8")
+        except OSError:
+            # Caching is only an optimisation; never fail the run over it.
+            pass
+    return driver_path
+
+
+def _is_listening(address: Tuple[str, int]) -> bool:
+    try:
+        with socket.create_connection(address, timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+
+def _is_chrome_debugger(address: Tuple[str, int]) -> bool:
+    """Return True if a Chrome remote debugging endpoint answers at `address`."""
+    # Talk to the endpoint directly: an HTTP(S)_PROXY from the environment
+    # must not be used for what is normally a localhost address.
+    opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+    try:
+        with opener.open(f"http://{address[0]}:{address[1]}/json/version", timeout=0.5) as response:
+            return "webSocketDebuggerUrl" in json.load(response)
+    except (OSError, ValueError):
+        return False
+
+
+def _launch_persistent_browser(
+    address: Tuple[str, int] = DEFAULT_DEBUGGING_ADDRESS, headless: bool = True
+) -> None:
+    """Start a Chrome that Selenium can attach to via its debugging port.
+
+    The browser is deliberately left running when the script exits, so that
+    later runs (or later terms within the same run) can open a tab in it
+    instead of paying for a cold browser start each time; stop it with
+    `stop_persistent_browser` (`--stop-browser` on the command line).  If a
+    Chrome debugging endpoint already answers on `address` it is reused;
+    any other program holding the port is reported as an error.
+
+    Unlike the short-lived browsers from `get_driver`, this one keeps
+    Chrome's sandbox enabled, since it may run for a long time with an
+    open DevTools port.
+    """
+    if _is_chrome_debugger(address):
+        return
+    if _is_listening(address):
+        raise RuntimeError(
+            f"{address[0]}:{address[1]} is in use by something other than a Chrome debugging endpoint"
+        )
+    binary = _find_chrome()
+    if binary is None:
+        raise RuntimeError("Could not find a Chrome or Chromium binary to launch")
+
+    _PERSISTENT_PROFILE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    command = [
+        binary,
+        *_CHROME_ARGS,
+        f"--remote-debugging-port={address[1]}",
+        f"--user-data-dir={_PERSISTENT_PROFILE_DIR}",
+    ]
+    if headless:
+        command.append("--headless=new")
+    # Start Chrome in its own session so it outlives this process (and is not
+    # hit by a Ctrl+C aimed at the script).  It is intentionally detached:
+    # nobody waits on it, and later runs find it again through the port.
+    process = subprocess.Popen(
+        command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True
+    )
+
+    deadline = time.monotonic() + 20
+    while not _is_chrome_debugger(address):
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            raise RuntimeError(f"Chrome did not open its debugging port on {address[0]}:{address[1]}")
+        time.sleep(0.1)
+    _PERSISTENT_PID_FILE.write_text(f"{process.pid}\n", encoding="utf-8")
+
+
+def stop_persistent_browser() -> bool:
+    """Stop the Chrome started by `_launch_persistent_browser`.
+
+    Returns
+    -------
+    bool
+        True if a browser was stopped, False if none was recorded as running.
+    """
+    try:
+        pid = int(_PERSISTENT_PID_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    _PERSISTENT_PID_FILE.unlink(missing_ok=True)
+    try:
+        # Chrome was started as the leader of its own process group, so this
+        # takes its helper processes down with it.
+        os.killpg(pid, signal.SIGTERM)
+    except ProcessLookupError:
+        return False
+    return True
 
 
-def get_driver(headless: bool = True) -> Chrome:
+def get_driver(headless: bool = True, attach_to: Tuple[str, int] | None = None) -> Chrome:
     """Initialise a Selenium Chrome WebDriver.
 
     Parameters
@@ -80,23 +373,52 @@ def get_driver(headless: bool = True) -> Chrome:
     headless : bool
         Run the browser in headless mode.  Set to False if you want to
         watch the automation unfold in a real browser window.
+    attach_to : Tuple[str, int] | None
+        Host and port of an already running Chrome (see
+        `_launch_persistent_browser`) to attach to instead of starting a new
+        browser.  The returned driver is switched to a new tab of its own;
+        `headless` has no effect in that case.
 
     Returns
     -------
     Chrome
         An instance of Selenium's Chrome driver.
+
+    Raises
+    ------
+    RuntimeError
+        If `attach_to` is given but no Chrome debugging endpoint answers there.
     """
     options = ChromeOptions()
-    if headless:
-        options.add_argument("--headless=new")  # use headless mode on modern Chrome
-    options.add_argument("--disable-gpu")
-    options.add_argument("--no-sandbox")
-    # Avoid detection where possible
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option('useAutomationExtension', False)
+    # Don't let driver.get() block on the page's load event (fonts, trackers
+    # and so on); callers wait explicitly for the elements they need.
+    options.page_load_strategy = "none"
+    if attach_to is not None:
+        if not _is_chrome_debugger(attach_to):
+            raise RuntimeError(f"No Chrome debugging endpoint is listening on {attach_to[0]}:{attach_to[1]}")
+        # The browser is already running with our switches; chromedriver
+        # rejects most launch-time options when attaching, so only tell it
+        # where to find the browser.
+        options.add_experimental_option("debuggerAddress", f"{attach_to[0]}:{attach_to[1]}")
+    else:
+        if headless:
+            options.add_argument("--headless=new")  # use headless mode on modern Chrome
+        # These browsers only live for a single run, typically inside a CI
+        # container where Chrome's sandbox is unavailable.
+        options.add_argument("--no-sandbox")
+        for arg in _CHROME_ARGS:
+            options.add_argument(arg)
+        options.add_experimental_option(
+            "prefs",
+            {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2,
+            },
+        )
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option('useAutomationExtension', False)
 
-    driver_path = ChromeDriverManager().install()
+    driver_path = _resolve_driver_path()
     # Selenium 4 expects the driver path to be passed via a Service object.  Passing
     # the path as the first positional argument results in the
     # "got multiple values for argument 'options'" TypeError seen when using
@@ -104,10 +426,78 @@ def get_driver(headless: bool = True) -> Chrome:
     # https://selenium-python.readthedocs.io/api.html#selenium.webdriver.chrome.webdriver.WebDriver
     service = Service(driver_path)
     driver = Chrome(service=service, options=options)
+    try:
+        if attach_to is not None:
+            # Work in a tab of our own so concurrent callers do not trample
+            # each other in the shared browser.
+            driver.switch_to.new_window("tab")
+        # The command line switches above do not hide navigator.webdriver,
+        # which Banner can use to serve automation a slower challenge page.
+        # Remove it before any page script runs.
+        driver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument",
+            {"source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"},
+        )
+    except Exception:
+        driver.quit()
+        raise
     return driver
 
 
-def collect_courses(term_code: str, headless: bool = True) -> List[CourseInfo]:
+def _cached_by_term(func: Callable[..., List[CourseInfo]]) -> Callable[..., List[CourseInfo]]:
+    """Cache a term's courses on disk for a limited time.
+
+    The wrapped function gains two keyword arguments: `cache_ttl`, the
+    maximum age in seconds of a cached result that may be reused, and
+    `use_cache`, which can be set to False to bypass the cache entirely.
+    Empty results are never cached since they usually point at a bad term
+    code or a failed run.  Every cache hit is announced on standard error
+    so that stale figures never pass unnoticed.
+    """
+
+    @functools.wraps(func)
+    def wrapper(
+        term_code: str,
+        *args,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        use_cache: bool = True,
+        **kwargs,
+    ) -> List[CourseInfo]:
+        if not use_cache or cache_ttl <= 0:
+            return func(term_code, *args, **kwargs)
+
+        path = _CACHE_DIR / f"{term_code}.v{_RESULTS_CACHE_VERSION}.pkl"
+        try:
+            mtime = path.stat().st_mtime
+            if time.time() - mtime < cache_ttl:
+                with path.open("rb") as f:
+                    courses = pickle.load(f)
+                stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(mtime))
+                print(f"Using cached results for term {term_code} from {stamp} (pass --no-cache to refresh)", file=sys.stderr)
+                return courses
+        except Exception:
+            # Missing, unreadable or stale-format cache files are just misses.
+            pass
+
+        courses = func(term_code, *args, **kwargs)
+        if courses:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with path.open("wb") as f:
+                    pickle.dump(courses, f, protocol=pickle.HIGHEST_PROTOCOL)
+            except OSError:
+                pass
+        return courses
+
+    return wrapper
+
+
+@_cached_by_term
+def collect_courses(
+    term_code: str,
+    headless: bool = True,
+    attach_to: Tuple[str, int] | None = None,
+) -> List[CourseInfo]:
     """Collect computer science course enrollment information for a given term.
 
     This function drives a headless browser to select the CST subject and
@@ -121,6 +511,14 @@ def collect_courses(term_code: str, headless: bool = True) -> List[CourseInfo]:
         Roosevelt University term code (e.g. 202610 for Fall 2025).
     headless : bool
         Run the browser in headless mode; set to False to debug.
+    attach_to : Tuple[str, int] | None
+        Open a tab in the Chrome listening on this debugging address instead
+        of starting a new browser.
+    cache_ttl : float
+        Reuse results cached on disk if they are younger than this many
+        seconds (default one hour).
+    use_cache : bool
+        Set to False to skip the on-disk cache and always query Banner.
 
     Returns
     -------
@@ -128,14 +526,18 @@ def collect_courses(term_code: str, headless: bool = True) -> List[CourseInfo]:
         A list of course information objects.
     """
     url = f"https://banner.roosevelt.edu/ssbprod/bwskzenr.P_CourseFinder?TERM={term_code}"
-    driver = get_driver(headless=headless)
+    driver = get_driver(headless=headless, attach_to=attach_to)
     try:
         driver.get(url)
 
-        wait = WebDriverWait(driver, 20)
+        wait = WebDriverWait(driver, 20, poll_frequency=0.1)
 
-        # The subjects multi‑select list has the id "subjects"; wait for it.
+        # With the "none" page load strategy get() returns straight away, so
+        # wait for the subjects multi‑select list (id "subjects") to appear
+        # and then for the document to finish parsing, so that the page's
+        # ready handlers are in place before we interact with it.
         subjects_select = wait.until(EC.presence_of_element_located((By.ID, "subjects")))
+        wait.until(lambda d: d.execute_script("return document.readyState") != "loading")
         select = Select(subjects_select)
 
         # Select the computer science subject (code "CST").  We deselect any
@@ -152,30 +554,108 @@ def collect_courses(term_code: str, headless: bool = True) -> List[CourseInfo]:
         # courseResultBox entry to appear.
         wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div.courseResultsBox .courseName")))
 
-        # Scroll down to ensure all courses are rendered.  The results load
-        # immediately, but some items may be outside the viewport; this scroll
-        # ensures lazy‑loaded images or dynamic content has time to appear.
+        # Scroll to the bottom in case the page renders further results as
+        # they come into view, then wait for the list to settle: poll the
+        # number of result boxes every 100 ms and carry on as soon as two
+        # consecutive polls agree, instead of sleeping for a fixed time.
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(1)
+        last_count = -1
+
+        def _results_settled(d) -> bool:
+            nonlocal last_count
+            count = len(d.find_elements(By.CSS_SELECTOR, "div.courseResultsBox"))
+            settled = count > 0 and count == last_count
+            last_count = count
+            return settled
+
+        wait.until(_results_settled)
 
         # Each course is contained within a DIV.courseResultsBox.  Inside each
-        # there are several labelled fields.
-        course_boxes = driver.find_elements(By.CSS_SELECTOR, "div.courseResultsBox")
+        # there are several labelled fields.  Rather than querying them one
+        # WebDriver round trip at a time, fetch the rendered page once and
+        # pick the boxes apart with lxml.  Boxes missing any of the fields
+        # are decorative and are skipped.
+        tree = lxml.html.fromstring(driver.page_source)
         courses: List[CourseInfo] = []
-        for box in course_boxes:
-            try:
-                title = box.find_element(By.CSS_SELECTOR, "div.courseName").text.strip()
-                class_code = box.find_element(By.CSS_SELECTOR, "#classID .dataValue").text.strip()
-                enrolled = box.find_element(By.CSS_SELECTOR, "#enrollID .dataValue").text.strip()
-                wait_list = box.find_element(By.CSS_SELECTOR, "#waitID .dataValue").text.strip()
-                courses.append(CourseInfo(title, class_code, enrolled, wait_list))
-            except Exception:
-                # Some boxes may be decorative or missing fields; skip them.
+        for box in _COURSE_BOX_XPATH(tree):
+            title = _COURSE_NAME_XPATH(box)
+            class_code = _CLASS_XPATH(box)
+            enrolled = _ENROLLED_XPATH(box)
+            wait_list = _WAIT_XPATH(box)
+            if not (title and class_code and enrolled and wait_list):
                 continue
+            courses.append(
+                CourseInfo(
+                    _text(title[0]),
+                    _text(class_code[0]),
+                    _text(enrolled[0]),
+                    _text(wait_list[0]),
+                )
+            )
 
         return courses
     finally:
-        driver.quit()
+        try:
+            if attach_to is not None:
+                # Close only our tab; quitting an attached session leaves the
+                # browser itself running for the next caller.
+                driver.close()
+        finally:
+            driver.quit()
+
+
+async def collect_courses_many(
+    term_codes: List[str],
+    max_concurrency: int = 5,
+    headless: bool = True,
+    attach_to: Tuple[str, int] | None = None,
+    cache_ttl: float = DEFAULT_CACHE_TTL,
+    use_cache: bool = True,
+) -> Dict[str, List[CourseInfo] | BaseException]:
+    """Collect course information for several terms concurrently.
+
+    Each term is fetched with `collect_courses` on a worker thread; a
+    semaphore keeps at most `max_concurrency` browsers open at once so we
+    do not hammer Banner.
+
+    Parameters
+    ----------
+    term_codes : List[str]
+        Roosevelt University term codes to fetch.
+    max_concurrency : int
+        Upper bound on the number of terms fetched at the same time.
+    headless, attach_to, cache_ttl, use_cache
+        Passed through to `collect_courses`.
+
+    Returns
+    -------
+    Dict[str, List[CourseInfo] | BaseException]
+        For each term, in the order given, either its courses or the
+        exception raised while collecting it.  One failing term does not
+        discard the results of the others.
+
+    Raises
+    ------
+    ValueError
+        If `max_concurrency` is less than 1.
+    """
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _collect(term_code: str) -> List[CourseInfo]:
+        async with semaphore:
+            return await asyncio.to_thread(
+                collect_courses,
+                term_code,
+                headless=headless,
+                attach_to=attach_to,
+                cache_ttl=cache_ttl,
+                use_cache=use_cache,
+            )
+
+    results = await asyncio.gather(*(_collect(term) for term in term_codes), return_exceptions=True)
+    return dict(zip(term_codes, results))
 
 
 def print_courses(courses: List[CourseInfo]) -> None:
@@ -183,67 +663,36 @@ def print_courses(courses: List[CourseInfo]) -> None:
     if not courses:
         print("No courses were found.  Verify the term code and try again.")
         return
-    # Determine column widths
-    title_width = max(len("Title"), max(len(c.title) for c in courses))
-    class_width = max(len("Class"), max(len(c.class_code) for c in courses))
-    enrolled_width = max(len("Enrolled"), max(len(c.enrolled) for c in courses))
-    wait_width = max(len("Wait List"), max(len(c.wait_list) for c in courses))
+    # Determine column widths in a single pass over the courses.
+    title_width, class_width = len("Title"), len("Class")
+    enrolled_width, wait_width = len("Enrolled"), len("Wait List")
+    for c in courses:
+        title_width = max(title_width, len(c.title))
+        class_width = max(class_width, len(c.class_code))
+        enrolled_width = max(enrolled_width, len(c.enrolled))
+        wait_width = max(wait_width, len(c.wait_list))
+    # Build the row format once and reuse it for every line of both tables.
     # Note: there must be no spaces inside the format specifier braces.  Having
-    # spaces (e.g. { 'Title':<{width} }) causes Python to interpret the space as
-    # part of the format code, resulting in a ValueError.
-    header = (
-        f"{'Title':<{title_width}}  "
-        f"{'Class':<{class_width}}  "
-        f"{'Enrolled':<{enrolled_width}}  "
-        f"{'Wait List':<{wait_width}}"
-    )
+    # spaces (e.g. { :<20 }) causes Python to interpret the space as part of
+    # the format code, resulting in a ValueError.
+    row_fmt = f"{{:<{title_width}}}  {{:<{class_width}}}  {{:<{enrolled_width}}}  {{:<{wait_width}}}"
+    header = row_fmt.format("Title", "Class", "Enrolled", "Wait List")
+    rule = "-" * len(header)
     print(header)
-    print("-" * len(header))
+    print(rule)
     for course in courses:
-        row = (
-            f"{course.title:<{title_width}}  "
-            f"{course.class_code:<{class_width}}  "
-            f"{course.enrolled:<{enrolled_width}}  "
-            f"{course.wait_list:<{wait_width}}"
-        )
-        print(row)
+        print(row_fmt.format(course.title, course.class_code, course.enrolled, course.wait_list))
 
     # Identify courses that either have low enrollment (<= 10 students enrolled)
-    # or have one or more students on the wait list.  We'll parse the strings
-    # like "9 / 25" and "0 / 46" to extract the current and limit values.  If
-    # parsing fails we simply skip that course in this special section.
-    def _parse_pair(pair: str) -> tuple[int, int]:
-        try:
-            current, limit = pair.split("/")
-            return int(current.strip()), int(limit.strip())
-        except Exception:
-            return 0, 0
-
-    flagged: List[CourseInfo] = []
-    for c in courses:
-        enrolled_current, _ = _parse_pair(c.enrolled)
-        wait_current, _ = _parse_pair(c.wait_list)
-        if enrolled_current <= 10 or wait_current > 0:
-            flagged.append(c)
+    # or have one or more students on the wait list.
+    flagged = [c for c in courses if c.enrolled_count <= 10 or c.wait_count > 0]
 
     if flagged:
         print("\nCourses of interest (≤ 10 enrolled or students on the wait list):")
-        flagged_header = (
-            f"{'Title':<{title_width}}  "
-            f"{'Class':<{class_width}}  "
-            f"{'Enrolled':<{enrolled_width}}  "
-            f"{'Wait List':<{wait_width}}"
-        )
-        print(flagged_header)
-        print("-" * len(flagged_header))
+        print(header)
+        print(rule)
         for course in flagged:
-            row = (
-                f"{course.title:<{title_width}}  "
-                f"{course.class_code:<{class_width}}  "
-                f"{course.enrolled:<{enrolled_width}}  "
-                f"{course.wait_list:<{wait_width}}"
-            )
-            print(row)
+            print(row_fmt.format(course.title, course.class_code, course.enrolled, course.wait_list))
 
 
 def save_csv(courses: List[CourseInfo], path: str) -> None:
@@ -251,23 +700,65 @@ def save_csv(courses: List[CourseInfo], path: str) -> None:
     with open(path, "w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
         writer.writerow(["Title", "Class", "Enrolled", "Wait List"])
-        for c in courses:
-            writer.writerow([c.title, c.class_code, c.enrolled, c.wait_list])
+        writer.writerows(c.csv_row() for c in courses)
     print(f"Saved {len(courses)} courses to {path}")
 
 
 def main(argv: List[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Retrieve RU computer science course enrollments.")
-    parser.add_argument("--term", dest="term", required=True, help="Term code, e.g. 202610 for Fall 2025")
+    term_group = parser.add_mutually_exclusive_group(required=True)
+    term_group.add_argument("--term", dest="term", help="Term code, e.g. 202610 for Fall 2025")
+    term_group.add_argument("--terms", dest="terms", help="Comma-separated term codes to fetch concurrently, e.g. 202610,202620")
+    term_group.add_argument("--stop-browser", action="store_true", help="Stop the long-lived Chrome started by --reuse-browser and exit")
+    parser.add_argument("--max-concurrency", type=int, default=5, help="Maximum number of terms fetched at once with --terms (default: 5)")
     parser.add_argument("--csv", dest="csv_path", help="Optional path to save results as CSV")
+    parser.add_argument("--cache-ttl", type=float, default=DEFAULT_CACHE_TTL, help="Reuse results cached within this many seconds (default: 3600)")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore the on-disk results cache and always query Banner")
     parser.add_argument("--show-browser", action="store_true", help="Show the browser window instead of running headless")
+    parser.add_argument("--reuse-browser", action="store_true", help="Attach to (or start) a long-lived Chrome on localhost:9222 instead of launching a new one")
     args = parser.parse_args(argv)
+    if args.max_concurrency < 1:
+        parser.error("--max-concurrency must be at least 1")
 
-    courses = collect_courses(term_code=args.term, headless=not args.show_browser)
-    print_courses(courses)
-    if args.csv_path:
-        save_csv(courses, args.csv_path)
-    return 0
+    if args.stop_browser:
+        if not stop_persistent_browser():
+            print("No long-lived browser was running.")
+        return 0
+
+    options = dict(headless=not args.show_browser, cache_ttl=args.cache_ttl, use_cache=not args.no_cache)
+    if args.reuse_browser:
+        try:
+            _launch_persistent_browser(DEFAULT_DEBUGGING_ADDRESS, headless=options["headless"])
+        except RuntimeError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 1
+        options["attach_to"] = DEFAULT_DEBUGGING_ADDRESS
+    if args.term:
+        results = {args.term: collect_courses(args.term, **options)}
+    else:
+        # dict.fromkeys drops duplicates (which would share a CSV file) while
+        # keeping the given order.
+        terms = list(dict.fromkeys(t.strip() for t in args.terms.split(",") if t.strip()))
+        if not terms:
+            parser.error("--terms requires at least one term code")
+        results = asyncio.run(collect_courses_many(terms, max_concurrency=args.max_concurrency, **options))
+
+    failed = False
+    for term_code, courses in results.items():
+        if isinstance(courses, BaseException):
+            print(f"Could not collect term {term_code}: {type(courses).__name__}: {courses}".rstrip(), file=sys.stderr)
+            failed = True
+            continue
+        if len(results) > 1:
+            print(f"\nTerm {term_code}:")
+        print_courses(courses)
+        if args.csv_path:
+            path = args.csv_path
+            if len(results) > 1:
+                root, ext = os.path.splitext(path)
+                path = f"{root}_{term_code}{ext}"
+            save_csv(courses, path)
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":